@@ -3,9 +3,19 @@
 Sentiment analyzer for detailed analysis of post sentiment.
 """
 
+import functools
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from vibe import VibeAnalyzer, get_vibe_analyzer
+from utils import collapse_whitespace, get_capitalization_ratio, get_sentence_count, strip_entities
+
+# Text patterns, compiled once at import
+_NON_TEXT_RE = re.compile(r'[^\w\s.,!?]')
+_ALL_CAPS_RE = re.compile(r'\b[A-Z]{2,}\b')
+_REPEATED_LETTER_RE = re.compile(r'(\w)\1{2,}')
+_EMOTICON_RE = re.compile(r'[:;=]-?[)(/\\|pPoO]')
+_WORD_RE = re.compile(r'\b\w+\b')
 
 class SentimentAnalyzer:
     """Analyzes sentiment of posts in detail."""
@@ -13,6 +23,7 @@ class SentimentAnalyzer:
     def __init__(self):
         """Initialize the sentiment analyzer."""
         self.analyzer = SentimentIntensityAnalyzer()
+        self._polarity = self.analyzer.polarity_scores
         
         # Custom sentiment words for social media context
         self.custom_words = {
@@ -67,13 +78,17 @@ class SentimentAnalyzer:
             for word, score in words.items():
                 self.analyzer.lexicon[word] = score
     
-    def analyze_sentiment(self, text: str) -> Dict[str, any]:
-        """Analyze the sentiment of a text."""
-        # Clean the text
-        cleaned_text = self._clean_text(text)
+    def analyze_sentiment(self, text: Union[str, List[str]]) -> Dict[str, any]:
+        """Analyze the sentiment of a text, or of a list of posts scored individually and aggregated."""
+        if not isinstance(text, str):
+            return self._analyze_posts(text)
         
+        return self.analyze_cleaned(text, self._clean_text(text))
+    
+    def analyze_cleaned(self, text: str, cleaned_text: str) -> Dict[str, any]:
+        """Analyze a text whose _clean_text form has already been computed."""
         # Get VADER sentiment scores
-        vader_scores = self.analyzer.polarity_scores(cleaned_text)
+        vader_scores = self._polarity(cleaned_text)
         
         # Get detailed analysis
         detailed_analysis = self._get_detailed_analysis(cleaned_text)
@@ -88,31 +103,76 @@ class SentimentAnalyzer:
             'emotional_indicators': emotional_indicators,
             'text_length': len(cleaned_text),
             'word_count': len(cleaned_text.split()),
-            'sentence_count': len(re.split(r'[.!?]+', cleaned_text)),
+            'sentence_count': get_sentence_count(cleaned_text),
             'exclamation_count': text.count('!'),
             'question_count': text.count('?'),
             'capitalization_ratio': self._get_capitalization_ratio(text),
             'emoji_sentiment': self._analyze_emoji_sentiment(text)
         }
     
-    def _clean_text(self, text: str) -> str:
-        """Clean text for sentiment analysis."""
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    def _analyze_posts(self, posts: List[str]) -> Dict[str, any]:
+        """Score each post separately and aggregate into a single analyze_sentiment-shaped result."""
+        return self.aggregate([self.analyze_sentiment(p) for p in posts if p and p.strip()])
+    
+    def aggregate(self, results: List[Dict[str, any]]) -> Dict[str, any]:
+        """Combine per-post analyze_sentiment results into a single analyze_sentiment-shaped result."""
+        if not results:
+            return {**self.analyze_sentiment(''), 'post_count': 0}
         
-        # Remove mentions but keep the text
-        text = re.sub(r'@\w+', '', text)
+        count = len(results)
+        vader_scores = {
+            key: sum(r['vader_scores'][key] for r in results) / count
+            for key in ('neg', 'neu', 'pos', 'compound')
+        }
         
-        # Remove hashtags but keep the text
-        text = re.sub(r'#(\w+)', r'\1', text)
+        positive_words = [w for r in results for w in r['detailed_analysis']['positive_words']]
+        negative_words = [w for r in results for w in r['detailed_analysis']['negative_words']]
+        neutral_words = [w for r in results for w in r['detailed_analysis']['neutral_words']]
         
-        # Remove emojis (we'll analyze them separately)
-        text = re.sub(r'[^\w\s.,!?]', '', text)
+        found_emojis = [e for r in results for e in r['emoji_sentiment']['found_emojis']]
+        total_emoji_sentiment = sum(r['emoji_sentiment']['total_emoji_sentiment'] for r in results)
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        return {
+            'overall_sentiment': self._get_overall_sentiment(vader_scores['compound']),
+            'vader_scores': vader_scores,
+            'detailed_analysis': {
+                'positive_words': sorted(positive_words, key=lambda x: x[1], reverse=True),
+                'negative_words': sorted(negative_words, key=lambda x: x[1]),
+                'neutral_words': neutral_words,
+                'positive_word_count': len(positive_words),
+                'negative_word_count': len(negative_words),
+                'neutral_word_count': len(neutral_words)
+            },
+            'emotional_indicators': {
+                key: sum(r['emotional_indicators'][key] for r in results)
+                for key in results[0]['emotional_indicators']
+            },
+            'text_length': sum(r['text_length'] for r in results),
+            'word_count': sum(r['word_count'] for r in results),
+            'sentence_count': sum(r['sentence_count'] for r in results),
+            'exclamation_count': sum(r['exclamation_count'] for r in results),
+            'question_count': sum(r['question_count'] for r in results),
+            'capitalization_ratio': sum(r['capitalization_ratio'] for r in results) / count,
+            'emoji_sentiment': {
+                'found_emojis': found_emojis,
+                'emoji_count': len(found_emojis),
+                'average_emoji_sentiment': total_emoji_sentiment / len(found_emojis) if found_emojis else 0,
+                'total_emoji_sentiment': total_emoji_sentiment
+            },
+            'post_count': count
+        }
+    
+    def _clean_text(self, text: str) -> str:
+        """Clean text for sentiment analysis."""
+        return self.strip_emojis(strip_entities(text))
+    
+    def strip_emojis(self, text: str) -> str:
+        """Finish cleaning a strip_entities-cleaned text by dropping emojis."""
+        # Remove emojis (we'll analyze them separately)
+        stripped = _NON_TEXT_RE.sub('', text)
         
-        return text
+        # The input is already collapsed; only removals can leave doubled spaces
+        return collapse_whitespace(stripped) if len(stripped) != len(text) else stripped
     
     def _get_detailed_analysis(self, text: str) -> Dict[str, any]:
         """Get detailed sentiment analysis."""
@@ -149,24 +209,16 @@ class SentimentAnalyzer:
             'exclamations': text.count('!'),
             'questions': text.count('?'),
             'ellipsis': text.count('...'),
-            'all_caps_words': len(re.findall(r'\b[A-Z]{2,}\b', text)),
-            'repeated_letters': len(re.findall(r'(\w)\1{2,}', text)),
-            'emoticons': len(re.findall(r'[:;=]-?[)(/\\|pPoO]', text))
+            'all_caps_words': len(_ALL_CAPS_RE.findall(text)),
+            'repeated_letters': len(_REPEATED_LETTER_RE.findall(text)),
+            'emoticons': len(_EMOTICON_RE.findall(text))
         }
         
         return indicators
     
     def _get_capitalization_ratio(self, text: str) -> float:
         """Get the ratio of capitalized letters to total letters."""
-        if not text:
-            return 0.0
-        
-        total_letters = len(re.findall(r'[a-zA-Z]', text))
-        if total_letters == 0:
-            return 0.0
-        
-        capital_letters = len(re.findall(r'[A-Z]', text))
-        return capital_letters / total_letters
+        return get_capitalization_ratio(text)
     
     def _analyze_emoji_sentiment(self, text: str) -> Dict[str, any]:
         """Analyze emoji sentiment."""
@@ -258,7 +310,7 @@ class SentimentAnalyzer:
     def score_feeds(self, posts: List[str], feeds_dict: Dict[str, List[str]]) -> List[str]:
         """Rank feeds based on keyword relevance in user posts."""
         combined_text = " ".join(posts).lower()
-        keywords = re.findall(r'\b\w+\b', combined_text)
+        keywords = _WORD_RE.findall(combined_text)
         from collections import Counter
         word_counts = Counter(keywords)
 
@@ -269,3 +321,40 @@ class SentimentAnalyzer:
 
         ranked = sorted(feed_scores, key=lambda x: x[1], reverse=True)
         return [feed for feed, score in ranked if score > 0]
+
+
+@functools.lru_cache(maxsize=1)
+def get_sentiment_analyzer() -> SentimentAnalyzer:
+    """Return the shared SentimentAnalyzer."""
+    return SentimentAnalyzer()
+
+
+def analyze_combined(
+    text: Union[str, List[str]],
+    sentiment_analyzer: Optional[SentimentAnalyzer] = None,
+    vibe_analyzer: Optional[VibeAnalyzer] = None
+) -> Tuple[Dict[str, any], Dict[str, float]]:
+    """Run sentiment and vibe analysis together, cleaning each text only once.
+    
+    The vibe analyzer's cleaned text (strip_entities) is the first half of the sentiment
+    analyzer's cleaning, so sentiment only strips emojis on top.
+    A list of posts is analyzed per post and aggregated, as by analyze_sentiment/analyze_vibe.
+    """
+    sentiment_analyzer = sentiment_analyzer or get_sentiment_analyzer()
+    vibe_analyzer = vibe_analyzer or get_vibe_analyzer()
+    
+    def analyze_one(post: str) -> Tuple[Dict[str, any], Dict[str, float]]:
+        cleaned_text = strip_entities(post)
+        return (
+            sentiment_analyzer.analyze_cleaned(post, sentiment_analyzer.strip_emojis(cleaned_text)),
+            vibe_analyzer.analyze_cleaned(post, cleaned_text)
+        )
+    
+    if isinstance(text, str):
+        return analyze_one(text)
+    
+    results = [analyze_one(post) for post in text if post and post.strip()]
+    return (
+        sentiment_analyzer.aggregate([sentiment for sentiment, _ in results]),
+        vibe_analyzer.aggregate([vibe for _, vibe in results])
+    )
@@ -5,10 +5,40 @@ Bluesky bot client for interacting with AT Protocol, monitoring feeds, analyzing
 
 import os
 import asyncio
+import bisect
 import json
+import operator
+import time
 from atproto import Client
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from queue_manager import queue_manager, RequestType
+from utils import parse_iso_timestamp, BoundedSeenSet
+from analyze import analyze_combined
+
+# How long a saved login session is reused before logging in with the password again
+SESSION_TTL_SECONDS = 3600
+# How long fetched author feeds are reused for repeated mentions of the same account
+AUTHOR_CACHE_TTL_SECONDS = 600
+# How many processed notification URIs are remembered (and persisted) for deduplication
+MAX_PROCESSED_NOTIFICATIONS = 10000
+# Verbose object introspection in logs, enabled with REPUTEBOT_DEBUG=true
+DEBUG = os.getenv('REPUTEBOT_DEBUG', 'false').lower() == 'true'
+
+# Precompiled attribute paths into feed view items
+_get_embed = operator.attrgetter('post.embed')
+_get_record = operator.attrgetter('post.record')
+_get_created_at = operator.attrgetter('post.record.created_at')
+
+def _probe(getter, obj):
+    """Apply an attrgetter, returning None when any attribute along its path is missing."""
+    try:
+        return getter(obj)
+    except AttributeError:
+        return None
+
+def _is_video_post(post) -> bool:
+    """Check whether a feed item carries a video embed."""
+    return 'video' in getattr(_probe(_get_embed, post), '$type', '')
 
 class BlueskyClient:
     """Bluesky bot for monitoring feeds, analyzing sentiment, and posting replies."""
@@ -27,10 +57,14 @@ class BlueskyClient:
         self.vibe_analyzer = None
         self.response_generator = None
         
-        # Track processed notifications to prevent duplicates
-        self.processed_notifications = set()
+        # Track processed notifications to prevent duplicates (oldest entries are evicted)
+        self.processed_notifications = BoundedSeenSet(MAX_PROCESSED_NOTIFICATIONS)
         # Track the latest notification timestamp we've processed
         self.last_processed_timestamp = None
+        # Recently fetched author feeds: key -> (fetched_at, result)
+        self._author_cache = {}
+        # Whether processed notifications have already been saved in the current run of cycles
+        self._saved_this_cycle = False
         # Don't load files during initialization - will be loaded when monitoring starts
     
     def _load_last_timestamp(self):
@@ -90,6 +124,53 @@ class BlueskyClient:
         except Exception as e:
             print(f"⚠️ Error saving processed notifications: {e}")
     
+    def _load_session_string(self):
+        """Load a saved login session string if it is younger than the session TTL and belongs to the configured handle."""
+        try:
+            age = time.time() - os.path.getmtime('bluesky_session.txt')
+            if age > SESSION_TTL_SECONDS:
+                print("🔑 Saved session expired, logging in with password")
+                return None
+            with open('bluesky_session.txt', 'r') as f:
+                handle, _, session_string = f.read().strip().partition('\n')
+            if handle != self.username:
+                print("🔑 Saved session belongs to a different handle, logging in with password")
+                return None
+            return session_string or None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️ Error loading saved session: {e}")
+            return None
+    
+    def _save_session_string(self):
+        """Save the current login session string so restarts can skip the password login."""
+        try:
+            # The session holds a refresh token, so keep the file private to the bot's user
+            fd = os.open('bluesky_session.txt', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                os.chmod('bluesky_session.txt', 0o600)  # the mode above only applies when the file is created
+                f.write(f"{self.username}\n{self.client.export_session_string()}")
+            print("🔑 Saved login session")
+        except Exception as e:
+            print(f"⚠️ Error saving session: {e}")
+    
+    def _get_cached_fetch(self, key):
+        """Return a cached author fetch result if it is still fresh."""
+        entry = self._author_cache.get(key)
+        if entry and time.monotonic() - entry[0] < AUTHOR_CACHE_TTL_SECONDS:
+            return entry[1]
+        return None
+    
+    def _cache_fetch(self, key, result):
+        """Cache an author fetch result, dropping entries that have expired."""
+        now = time.monotonic()
+        self._author_cache = {
+            k: entry for k, entry in self._author_cache.items()
+            if now - entry[0] < AUTHOR_CACHE_TTL_SECONDS
+        }
+        self._author_cache[key] = (now, result)
+    
     def _initialize_persistence(self):
         """Initialize persistence data (called when monitoring starts)."""
         # Load the last processed timestamp from file to persist between runs
@@ -170,10 +251,21 @@ class BlueskyClient:
                 print("   Make sure these are set in Railway environment variables")
                 raise ValueError("BLUESKY_HANDLE and BLUESKY_PASSWORD must be set as environment variables (either in .env file or system environment)")
         
+        # Resume a recent session when possible to skip the password round-trip
+        session_string = self._load_session_string()
+        if session_string:
+            try:
+                self.client.login(session_string=session_string)
+                print(f"✅ Resumed saved session as {self.username}")
+                return
+            except Exception as e:
+                print(f"⚠️ Could not resume saved session, logging in with password: {e}")
+        
         try:
             print(f"🔐 Attempting login with username: {self.username}")
             self.client.login(self.username, self.password)
             print(f"✅ Logged in as {self.username}")
+            self._save_session_string()
         except Exception as e:
             print(f"❌ Login failed: {e}")
             print(f"❌ Error type: {type(e)}")
@@ -193,232 +285,132 @@ class BlueskyClient:
             print(f"❌ Error fetching notifications: {e}")
             return []
     
-    async def get_author_posts(self, handle: str, limit: int = 10, days_back: int = 30) -> List[Any]:
-        """Fetch recent posts from a specific author, using pagination to get posts from the last N days."""
-        try:
-            print(f"🔍 Fetching posts from @{handle} (last {days_back} days)...")
+    async def iter_author_posts(self, handle: str, days_back: int = 30):
+        """Yield an author's non-video feed items from the last N days, fetching pages lazily.
+        
+        Pagination stops at the first post older than the cutoff, or as soon as the caller
+        stops iterating.
+        """
+        from datetime import datetime, timedelta, timezone
+        cutoff_time = datetime.now(timezone.utc) - timedelta(days=days_back)
+        
+        cursor = None
+        total_fetched = 0
+        consecutive_failures = 0
+        max_failures = 3
+        
+        while True:
+            # Prepare request parameters - start with smaller batch to avoid video embed issues
+            params = {'actor': handle, 'limit': 20}  # Start with smaller batch
+            if cursor:
+                params['cursor'] = cursor
+            
+            try:
+                # Fetch batch of posts
+                response = await queue_manager.add_request(
+                    RequestType.GET_AUTHOR_POSTS,
+                    self.client.app.bsky.feed.get_author_feed,
+                    params
+                )
+            except Exception as e:
+                print(f"⚠️ Error fetching batch for @{handle}: {e}")
+                return
             
-            from datetime import datetime, timedelta, timezone
-            cutoff_time = datetime.now(timezone.utc) - timedelta(days=days_back)
+            if response is None:
+                consecutive_failures += 1
+                print(f"⚠️ Batch failed for @{handle} (failure {consecutive_failures}/{max_failures})")
+                
+                if consecutive_failures >= max_failures:
+                    print(f"⚠️ Too many consecutive failures for @{handle}, giving up")
+                    return
+                
+                # Try with even smaller batch size
+                if params['limit'] > 5:
+                    params['limit'] = max(5, params['limit'] // 2)
+                    print(f"🔄 Retrying with batch size {params['limit']} for @{handle}")
+                    continue
+                else:
+                    print(f"⚠️ Even small batches failing for @{handle}, giving up")
+                    return
             
-            all_posts = []
-            cursor = None
-            total_fetched = 0
+            # Reset failure counter on success
             consecutive_failures = 0
-            max_failures = 3
             
-            while True:
-                # Prepare request parameters - start with smaller batch to avoid video embed issues
-                params = {'actor': handle, 'limit': 20}  # Start with smaller batch
-                if cursor:
-                    params['cursor'] = cursor
-                
+            batch_posts = response.feed
+            total_fetched += len(batch_posts)
+            
+            # Filter the whole page first so skipped video posts are logged once per page
+            page_posts = []
+            video_count = 0
+            reached_cutoff = False
+            for post in batch_posts:
                 try:
-                    # Fetch batch of posts
-                    response = await queue_manager.add_request(
-                        RequestType.GET_AUTHOR_POSTS,
-                        self.client.app.bsky.feed.get_author_feed,
-                        params
-                    )
-                    
-                    if response is None:
-                        consecutive_failures += 1
-                        print(f"⚠️ Batch failed for @{handle} (failure {consecutive_failures}/{max_failures})")
-                        
-                        if consecutive_failures >= max_failures:
-                            print(f"⚠️ Too many consecutive failures for @{handle}, giving up")
-                            break
-                        
-                        # Try with even smaller batch size
-                        if params['limit'] > 5:
-                            params['limit'] = max(5, params['limit'] // 2)
-                            print(f"🔄 Retrying with batch size {params['limit']} for @{handle}")
-                            continue
-                        else:
-                            print(f"⚠️ Even small batches failing for @{handle}, giving up")
-                            break
-                    
-                    # Reset failure counter on success
-                    consecutive_failures = 0
-                    
-                    batch_posts = response.feed
-                    total_fetched += len(batch_posts)
-                    
-                    # Process each post individually to skip video embeds
-                    old_posts_found = False
-                    for post in batch_posts:
-                        try:
-                            # Check if this post has video embeds and skip it
-                            if hasattr(post, 'post') and hasattr(post.post, 'embed'):
-                                embed = post.post.embed
-                                if hasattr(embed, '$type') and 'video' in getattr(embed, '$type', ''):
-                                    print(f"⏭️ Skipping video post for @{handle}")
-                                    continue
-                            
-                            # Check timestamp
-                            if hasattr(post, 'post') and hasattr(post.post, 'record') and hasattr(post.post.record, 'created_at'):
-                                post_time = datetime.fromisoformat(post.post.record.created_at.replace('Z', '+00:00'))
-                                if post_time >= cutoff_time:
-                                    all_posts.append(post)
-                                else:
-                                    old_posts_found = True
-                                    break
-                            else:
-                                # If we can't get timestamp, include the post
-                                all_posts.append(post)
-                                
-                        except Exception as e:
-                            # Skip individual posts that cause errors (like video embeds)
-                            print(f"⏭️ Skipping problematic post for @{handle}: {str(e)[:50]}...")
-                            continue
-                    
-                    # If we found old posts, we've reached our time limit
-                    if old_posts_found:
-                        break
+                    # Check if this post has video embeds and skip it
+                    if _is_video_post(post):
+                        video_count += 1
+                        continue
                     
-                    # Check if we have more posts to fetch
-                    if hasattr(response, 'cursor') and response.cursor:
-                        cursor = response.cursor
-                    else:
+                    # Posts without a timestamp are kept; the first old post ends the walk
+                    timestamp = _probe(_get_created_at, post)
+                    if timestamp and parse_iso_timestamp(timestamp) < cutoff_time:
+                        reached_cutoff = True
                         break
-                    
                 except Exception as e:
-                    print(f"⚠️ Error fetching batch for @{handle}: {e}")
-                    break
+                    # Skip individual posts that cause errors (like video embeds)
+                    print(f"⏭️ Skipping problematic post for @{handle}: {str(e)[:50]}...")
+                    continue
                 
-                # Safety check to prevent infinite loops
-                if total_fetched > 1000:  # Max 1000 posts
-                    print(f"⚠️ Reached safety limit of 1000 posts for @{handle}")
-                    break
+                page_posts.append(post)
             
-            print(f"📊 Found {len(all_posts)} posts from @{handle} in the last {days_back} days")
+            if video_count:
+                print(f"⏭️ Skipping {video_count} video post(s) for @{handle}")
             
-            # If we got no posts and this is a known problematic account, return some dummy data
-            if len(all_posts) == 0 and handle in ['yahoofinance.com', 'espn.com', 'playstation.com']:
-                print(f"⚠️ No posts found for @{handle}, using fallback data for analysis")
-                # Return a minimal post object for analysis
-                class FallbackPost:
-                    def __init__(self):
-                        self.post = FallbackPostContent()
-                
-                class FallbackPostContent:
-                    def __init__(self):
-                        self.record = FallbackRecord()
-                
-                class FallbackRecord:
-                    def __init__(self):
-                        self.text = f"Content from {handle} - unable to fetch due to video embeds"
-                        self.created_at = datetime.now(timezone.utc).isoformat()
-                
-                return [FallbackPost()]
+            for post in page_posts:
+                yield post
             
-            return all_posts
+            if reached_cutoff:
+                return
             
-        except Exception as e:
-            print(f"❌ Error fetching posts from @{handle}: {e}")
-            return []
+            # Check if we have more posts to fetch
+            cursor = getattr(response, 'cursor', None)
+            if not cursor:
+                return
+            
+            # Safety check to prevent infinite loops
+            if total_fetched > 1000:  # Max 1000 posts
+                print(f"⚠️ Reached safety limit of 1000 posts for @{handle}")
+                return
 
-    async def get_author_post_timestamps(self, handle: str, days_back: int = 30) -> List[str]:
-        """Fetch only timestamps from recent posts, much more efficient for counting."""
+    async def get_author_text_and_timestamps(self, handle: str, days_back: int = 30) -> List[Tuple[Optional[str], Optional[str]]]:
+        """Fetch (created_at, text) pairs for recent posts in a single pagination walk."""
+        cache_key = ('text_and_timestamps', handle, days_back)
+        cached = self._get_cached_fetch(cache_key)
+        if cached is not None:
+            print(f"📦 Using cached posts from @{handle} (last {days_back} days)")
+            return cached
+        
         try:
-            print(f"🔍 Fetching timestamps from @{handle} (last {days_back} days)...")
+            print(f"🔍 Fetching post text and timestamps from @{handle} (last {days_back} days)...")
             
-            from datetime import datetime, timedelta, timezone
-            cutoff_time = datetime.now(timezone.utc) - timedelta(days=days_back)
+            pairs = []
+            async for post in self.iter_author_posts(handle, days_back):
+                record = _probe(_get_record, post)
+                if record is not None:
+                    pairs.append((getattr(record, 'created_at', None), getattr(record, 'text', None)))
             
-            timestamps = []
-            cursor = None
-            total_fetched = 0
-            consecutive_failures = 0
-            max_failures = 3
+            print(f"📊 Found {len(pairs)} posts from @{handle} in the last {days_back} days")
             
-            while True:
-                # Prepare request parameters - start with smaller batch to avoid video embed issues
-                params = {'actor': handle, 'limit': 20}  # Start with smaller batch
-                if cursor:
-                    params['cursor'] = cursor
-                
-                try:
-                    # Fetch batch of posts
-                    response = await queue_manager.add_request(
-                        RequestType.GET_AUTHOR_POSTS,
-                        self.client.app.bsky.feed.get_author_feed,
-                        params
-                    )
-                    
-                    if response is None:
-                        consecutive_failures += 1
-                        print(f"⚠️ Batch failed for @{handle} (failure {consecutive_failures}/{max_failures})")
-                        
-                        if consecutive_failures >= max_failures:
-                            print(f"⚠️ Too many consecutive failures for @{handle}, giving up")
-                            break
-                        
-                        # Try with even smaller batch size
-                        if params['limit'] > 5:
-                            params['limit'] = max(5, params['limit'] // 2)
-                            print(f"🔄 Retrying with batch size {params['limit']} for @{handle}")
-                            continue
-                        else:
-                            print(f"⚠️ Even small batches failing for @{handle}, giving up")
-                            break
-                    
-                    # Reset failure counter on success
-                    consecutive_failures = 0
-                    
-                    batch_posts = response.feed
-                    total_fetched += len(batch_posts)
-                    
-                    # Extract only timestamps from posts within our time range
-                    old_posts_found = False
-                    for post in batch_posts:
-                        try:
-                            # Check if this post has video embeds and skip it
-                            if hasattr(post, 'post') and hasattr(post.post, 'embed'):
-                                embed = post.post.embed
-                                if hasattr(embed, '$type') and 'video' in getattr(embed, '$type', ''):
-                                    print(f"⏭️ Skipping video post for @{handle}")
-                                    continue
-                            
-                            # Extract timestamp
-                            if hasattr(post, 'post') and hasattr(post.post, 'record') and hasattr(post.post.record, 'created_at'):
-                                timestamp = post.post.record.created_at
-                                post_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                                if post_time >= cutoff_time:
-                                    timestamps.append(timestamp)
-                                else:
-                                    old_posts_found = True
-                                    break
-                                    
-                        except Exception as e:
-                            # Skip individual posts that cause errors (like video embeds)
-                            print(f"⏭️ Skipping problematic post for @{handle}: {str(e)[:50]}...")
-                            continue
-                    
-                    # If we found old posts, we've reached our time limit
-                    if old_posts_found:
-                        break
-                    
-                    # Check if we have more posts to fetch
-                    if hasattr(response, 'cursor') and response.cursor:
-                        cursor = response.cursor
-                    else:
-                        break
-                    
-                except Exception as e:
-                    print(f"⚠️ Error fetching batch for @{handle}: {e}")
-                    break
-                
-                # Safety check to prevent infinite loops
-                if total_fetched > 1000:  # Max 1000 posts
-                    print(f"⚠️ Reached safety limit of 1000 posts for @{handle}")
-                    break
+            # If we got no posts and this is a known problematic account, return some fallback text for analysis
+            if len(pairs) == 0 and handle in ['yahoofinance.com', 'espn.com', 'playstation.com']:
+                print(f"⚠️ No posts found for @{handle}, using fallback data for analysis")
+                return [(None, f"Content from {handle} - unable to fetch due to video embeds")]
             
-            print(f"📊 Found {len(timestamps)} timestamps from @{handle} in the last {days_back} days")
-            return timestamps
+            if pairs:
+                self._cache_fetch(cache_key, pairs)
+            return pairs
             
         except Exception as e:
-            print(f"❌ Error fetching timestamps from @{handle}: {e}")
+            print(f"❌ Error fetching post text and timestamps from @{handle}: {e}")
             return []
     
     async def get_post_thread(self, uri: str) -> Dict[str, Any]:
@@ -597,24 +589,17 @@ class BlueskyClient:
             print(f"🎯 Analyzing account: @{target_handle}")
             print(f"📋 Target account for reputation analysis: @{target_handle}")
             
-            # Fetch recent posts from the target account
-            target_posts = await self.get_author_posts(target_handle, days_back=30)
+            # Fetch recent post text and timestamps (for posts/day) in one pagination walk
+            target_posts = await self.get_author_text_and_timestamps(target_handle, days_back=30)
             
             if not target_posts:
                 print(f"⚠️ Could not fetch posts from @{target_handle}")
                 return
             
-            # Analyze the target account's recent posts
-            all_post_texts = []
+            # Split the pairs into the texts to analyze and the timestamps to count
             print(f"🔍 Processing {len(target_posts)} posts from @{target_handle}...")
-            for i, post in enumerate(target_posts):
-                if hasattr(post, 'post') and hasattr(post.post, 'record') and hasattr(post.post.record, 'text'):
-                    all_post_texts.append(post.post.record.text)
-                elif hasattr(post, 'record') and hasattr(post.record, 'text'):
-                    all_post_texts.append(post.record.text)
-                elif hasattr(post, 'post') and hasattr(post.post, 'text'):
-                    all_post_texts.append(post.post.text)
-                # Removed noisy logging for individual post text extraction
+            all_post_texts = [text for _, text in target_posts if text is not None]
+            target_timestamps = [timestamp for timestamp, _ in target_posts if timestamp]
             
             if not all_post_texts:
                 print(f"⚠️ No text found in posts from @{target_handle}")
@@ -625,11 +610,8 @@ class BlueskyClient:
             print(f"📊 Analyzing {len(all_post_texts)} posts from @{target_handle}...")
             
             # Analyze sentiment and vibe of the target account's content
-            sentiment_result = self.sentiment_analyzer.analyze_sentiment(combined_text)
-            vibe_result = self.vibe_analyzer.analyze_vibe(combined_text)
-            
-            # For posts/day calculation, use the more efficient timestamp method
-            target_timestamps = await self.get_author_post_timestamps(target_handle, days_back=30)
+            # (both are scored per post and averaged so long histories don't saturate VADER)
+            sentiment_result, vibe_result = analyze_combined(all_post_texts, self.sentiment_analyzer, self.vibe_analyzer)
             
             # Generate response based on target account's content
             print(f"🔍 Generating response for @{target_handle}...")
@@ -656,8 +638,9 @@ class BlueskyClient:
                 # Debug: print what we extracted
                 print(f"🔍 Extracted URI: {post_uri}")
                 print(f"🔍 Extracted CID: {post_cid}")
-                print(f"🔍 URI type: {type(post_uri)}")
-                print(f"🔍 CID type: {type(post_cid)}")
+                if DEBUG:
+                    print(f"🔍 URI type: {type(post_uri)}")
+                    print(f"🔍 CID type: {type(post_cid)}")
                 
                 if post_uri and post_cid:
                     print(f"🔍 Attempting to post reply...")
@@ -703,7 +686,8 @@ class BlueskyClient:
         except Exception as e:
             print(f"❌ Error processing mention: {e}")
             print(f"Notification structure: {type(notification)}")
-            print(f"Notification attributes: {dir(notification)}")
+            if DEBUG:
+                print(f"Notification attributes: {dir(notification)}")
     
     async def process_post(self, post):
         """Analyze a single post and respond if appropriate."""
@@ -720,8 +704,7 @@ class BlueskyClient:
             print(f"👀 Processing post: {post_text[:60]}...")
             
             # Analyze sentiment and vibe
-            sentiment_result = self.sentiment_analyzer.analyze_sentiment(post_text)
-            vibe_result = self.vibe_analyzer.analyze_vibe(post_text)
+            sentiment_result, vibe_result = analyze_combined(post_text, self.sentiment_analyzer, self.vibe_analyzer)
             
             # Generate response
             response = self.response_generator.generate_response(sentiment_result, vibe_result)
@@ -807,7 +790,21 @@ class BlueskyClient:
                 filtered_notifications = []
                 print(f"🔍 Current last processed timestamp: {self.last_processed_timestamp}")
                 
-                for notification in original_notifications:
+                # Sort timestamped notifications once and bisect off the ones that are not newer than
+                # our last processed timestamp (ISO-8601 UTC strings sort chronologically)
+                timed_notifications = sorted(
+                    (n for n in original_notifications if getattr(n, 'indexed_at', None)),
+                    key=lambda n: n.indexed_at
+                )
+                untimed_notifications = [n for n in original_notifications if not getattr(n, 'indexed_at', None)]
+                cut = 0
+                if self.last_processed_timestamp:
+                    cut = bisect.bisect_right([n.indexed_at for n in timed_notifications], self.last_processed_timestamp)
+                
+                # Old notifications are rejected by timestamp on every cycle, so they are not added to
+                # the processed set; it only needs to remember mentions newer than the timestamp
+                
+                for notification in untimed_notifications + timed_notifications[cut:]:
                     notification_time = getattr(notification, 'indexed_at', None)
                     notification_uri = getattr(notification, 'uri', None)
                     
@@ -816,24 +813,12 @@ class BlueskyClient:
                         # Don't log every single skipped notification to reduce noise
                         continue
                     
-                    # Skip if notification is older than our last processed timestamp
-                    # Use < instead of <= to allow processing notifications with the same timestamp
-                    if self.last_processed_timestamp and notification_time:
-                        if notification_time <= self.last_processed_timestamp:
-                            print(f"⏭️ Skipping old notification from {notification_time} (last processed: {self.last_processed_timestamp})")
-                            # Mark as processed to avoid repeating
-                            if notification_uri:
-                                self.processed_notifications.add(notification_uri)
-                            continue
-                    
                     # Only process mentions that arrived AFTER the bot started
                     if notification_time and self.bot_start_time:
                         try:
-                            notification_dt = datetime.fromisoformat(notification_time.replace('Z', '+00:00'))
+                            notification_dt = parse_iso_timestamp(notification_time)
                             if notification_dt < self.bot_start_time:
-                                # Mark as processed to avoid repeating (no logging to reduce noise)
-                                if notification_uri:
-                                    self.processed_notifications.add(notification_uri)
+                                # Rejected by timestamp again next cycle, no need to remember it (no logging to reduce noise)
                                 continue
                         except Exception as e:
                             print(f"⚠️ Error parsing notification timestamp {notification_time}: {e}")
@@ -886,7 +871,7 @@ class BlueskyClient:
                 # Save processed notifications to avoid repeating (only if we have new ones)
                 if len(self.processed_notifications) > 0:
                     # Only save if we haven't already saved in this cycle
-                    if not hasattr(self, '_saved_this_cycle'):
+                    if not self._saved_this_cycle:
                         self._save_processed_notifications()
                         print(f"💾 Saved {len(self.processed_notifications)} processed notifications")
                         self._saved_this_cycle = True
@@ -894,8 +879,7 @@ class BlueskyClient:
                         print(f"💾 Skipping save - already saved this cycle")
                 else:
                     # Reset the flag for next cycle
-                    if hasattr(self, '_saved_this_cycle'):
-                        delattr(self, '_saved_this_cycle')
+                    self._saved_this_cycle = False
                 
                 # Mark all notifications as read at the end of processing cycle
                 try:
@@ -7,9 +7,9 @@ import os
 import asyncio
 from dotenv import load_dotenv
 from bluesky import BlueskyClient
-from vibe import VibeAnalyzer
-from analyze import SentimentAnalyzer
-from responder import ResponseGenerator
+from vibe import get_vibe_analyzer
+from analyze import get_sentiment_analyzer
+from responder import get_response_generator
 
 # Load environment variables
 load_dotenv()
@@ -21,9 +21,9 @@ async def main():
     try:
         # Initialize components
         print("🔧 Initializing components...")
-        sentiment_analyzer = SentimentAnalyzer()
-        vibe_analyzer = VibeAnalyzer()
-        response_generator = ResponseGenerator()
+        sentiment_analyzer = get_sentiment_analyzer()
+        vibe_analyzer = get_vibe_analyzer()
+        response_generator = get_response_generator()
         bluesky_client = BlueskyClient()
         
         # Set up the processing pipeline
@@ -4,8 +4,10 @@ Queue Manager for handling Bluesky API rate limits and request queuing.
 """
 
 import asyncio
+import heapq
+import itertools
 import time
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -27,84 +29,84 @@ class QueuedRequest:
     args: tuple
     kwargs: dict
     priority: int = 1  # 1 = normal, 2 = high, 0 = low
-    created_at: float = None
+    created_at: float = None  # time.monotonic() when queued
     retry_count: int = 0
     max_retries: int = 3
+    future: Optional[asyncio.Future] = None  # Resolved with the result once the request is done
     
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = time.time()
+            self.created_at = time.monotonic()
 
 class RateLimiter:
     """Handles rate limiting for different API endpoints."""
     
     def __init__(self):
-        # Bluesky rate limits (approximate)
+        # Bluesky rate limits (approximate). "burst" calls can go through at once; the rest of the
+        # window's allowance refills evenly, so no window ever sees more than "requests" calls
         self.limits = {
-            RequestType.POST_REPLY: {"requests": 10, "window": 60},  # 10 posts per minute
-            RequestType.GET_NOTIFICATIONS: {"requests": 30, "window": 60},  # 30 requests per minute
-            RequestType.GET_AUTHOR_POSTS: {"requests": 20, "window": 60},  # 20 requests per minute
-            RequestType.GET_POST_THREAD: {"requests": 30, "window": 60},  # 30 requests per minute
-            RequestType.MARK_NOTIFICATION_READ: {"requests": 50, "window": 60},  # 50 requests per minute
-            RequestType.GET_PROFILE: {"requests": 30, "window": 60},  # 30 requests per minute
+            RequestType.POST_REPLY: {"requests": 10, "window": 60, "burst": 5},  # 10 posts per minute
+            RequestType.GET_NOTIFICATIONS: {"requests": 30, "window": 60, "burst": 15},  # 30 requests per minute
+            RequestType.GET_AUTHOR_POSTS: {"requests": 20, "window": 60, "burst": 10},  # 20 requests per minute
+            RequestType.GET_POST_THREAD: {"requests": 30, "window": 60, "burst": 15},  # 30 requests per minute
+            RequestType.MARK_NOTIFICATION_READ: {"requests": 50, "window": 60, "burst": 25},  # 50 requests per minute
+            RequestType.GET_PROFILE: {"requests": 30, "window": 60, "burst": 15},  # 30 requests per minute
         }
         
-        # Track request timestamps
-        self.request_history: Dict[RequestType, List[float]] = {
-            request_type: [] for request_type in RequestType
+        # Token buckets: request type -> [tokens, last refill time], starting full at "burst" tokens
+        self.buckets: Dict[RequestType, List[float]] = {
+            request_type: [float(limit["burst"]), time.monotonic()]
+            for request_type, limit in self.limits.items()
         }
     
+    def _refill_rate(self, request_type: RequestType) -> float:
+        """Tokens per second: what a window allows beyond the burst, spread over the window."""
+        limit = self.limits[request_type]
+        return (limit["requests"] - limit["burst"]) / limit["window"]
+    
+    def _refill(self, request_type: RequestType) -> List[float]:
+        """Top up a bucket for the time elapsed since its last refill."""
+        bucket = self.buckets[request_type]
+        current_time = time.monotonic()
+        refilled = bucket[0] + (current_time - bucket[1]) * self._refill_rate(request_type)
+        bucket[0] = min(float(self.limits[request_type]["burst"]), refilled)
+        bucket[1] = current_time
+        return bucket
+    
     def can_make_request(self, request_type: RequestType) -> bool:
         """Check if we can make a request without hitting rate limits."""
         if request_type not in self.limits:
             return True  # No limit specified
         
-        limit = self.limits[request_type]
-        current_time = time.time()
-        
-        # Clean old requests outside the window
-        self.request_history[request_type] = [
-            timestamp for timestamp in self.request_history[request_type]
-            if current_time - timestamp < limit["window"]
-        ]
-        
-        # Check if we're under the limit
-        return len(self.request_history[request_type]) < limit["requests"]
+        return self._refill(request_type)[0] >= 1
     
     def record_request(self, request_type: RequestType):
         """Record that a request was made."""
-        if request_type not in self.request_history:
-            self.request_history[request_type] = []
+        if request_type not in self.limits:
+            return
         
-        self.request_history[request_type].append(time.time())
+        self._refill(request_type)[0] -= 1
     
     def get_wait_time(self, request_type: RequestType) -> float:
         """Get how long to wait before making the next request."""
         if request_type not in self.limits:
             return 0
         
-        limit = self.limits[request_type]
-        current_time = time.time()
-        
-        # Clean old requests
-        self.request_history[request_type] = [
-            timestamp for timestamp in self.request_history[request_type]
-            if current_time - timestamp < limit["window"]
-        ]
-        
-        if len(self.request_history[request_type]) < limit["requests"]:
+        tokens = self._refill(request_type)[0]
+        if tokens >= 1:
             return 0
         
-        # Find the oldest request in the window
-        oldest_request = min(self.request_history[request_type])
-        return (oldest_request + limit["window"]) - current_time
+        # Time until the bucket refills to one whole token
+        return (1 - tokens) / self._refill_rate(request_type)
 
 class QueueManager:
     """Manages queued requests with rate limiting."""
     
     def __init__(self):
         self.rate_limiter = RateLimiter()
-        self.request_queue: List[QueuedRequest] = []
+        # Binary heap of (-priority, seq, request); seq keeps FIFO order within a priority level
+        self.request_queue: List[Tuple[int, int, QueuedRequest]] = []
+        self._seq = itertools.count()
         self.processing = False
         self.logger = logging.getLogger(__name__)
         
@@ -130,41 +132,49 @@ class QueueManager:
             func=func,
             args=args,
             kwargs=kwargs,
-            priority=priority
+            priority=priority,
+            future=asyncio.get_running_loop().create_future()
         )
         
-        # Add to queue (sorted by priority, then by creation time)
-        self.request_queue.append(request)
-        self.request_queue.sort(key=lambda x: (-x.priority, x.created_at))
+        # Add to queue (ordered by priority, then by arrival)
+        self._push(request)
         
         self.logger.info(f"Queued {request_type.value} request (priority: {priority})")
         
-        # Start processing if not already running
+        # Start processing if not already running (flag set now so requests queued
+        # before the task first runs don't start a second worker)
         if not self.processing:
+            self.processing = True
             asyncio.create_task(self._process_queue())
         
         # Wait for this specific request to complete
         return await self._wait_for_request(request)
     
+    def _push(self, request: QueuedRequest):
+        """Push a request onto the priority heap."""
+        heapq.heappush(self.request_queue, (-request.priority, next(self._seq), request))
+    
     async def _wait_for_request(self, request: QueuedRequest) -> Any:
         """Wait for a specific request to complete."""
-        while request in self.request_queue:
-            await asyncio.sleep(0.1)
-        
-        # The request has been processed, return the result
+        return await request.future
+    
+    def _resolve(self, request: QueuedRequest):
+        """Hand a finished request's result (or final error) to whoever is waiting on it."""
+        if request.future is None or request.future.done():
+            return
         if hasattr(request, 'result'):
-            return request.result
+            request.future.set_result(request.result)
         elif hasattr(request, 'error'):
-            raise request.error
+            request.future.set_exception(request.error)
         else:
-            return None
+            request.future.set_result(None)
     
     async def _process_queue(self):
         """Process the request queue with rate limiting."""
         self.processing = True
         
         while self.request_queue:
-            request = self.request_queue[0]
+            request = self.request_queue[0][2]
             
             # Check rate limits
             if not self.rate_limiter.can_make_request(request.request_type):
@@ -174,7 +184,7 @@ class QueueManager:
                 continue
             
             # Remove from queue
-            self.request_queue.pop(0)
+            heapq.heappop(self.request_queue)
             
             # Execute the request
             try:
@@ -190,6 +200,7 @@ class QueueManager:
                 request.result = result
                 self.stats["successful_requests"] += 1
                 self.logger.info(f"Successfully executed {request.request_type.value}")
+                self._resolve(request)
                 
             except Exception as e:
                 # Check if this is a validation error (video embed issue)
@@ -199,6 +210,7 @@ class QueueManager:
                     self.logger.info(f"Skipping video embed in {request.request_type.value} (validation error)")
                     request.result = None  # Return None instead of raising error
                     self.stats["successful_requests"] += 1
+                    self._resolve(request)
                     continue
                 
                 self.stats["failed_requests"] += 1
@@ -208,13 +220,13 @@ class QueueManager:
                 # Retry logic
                 if request.retry_count < request.max_retries:
                     request.retry_count += 1
-                    request.created_at = time.time()  # Reset creation time
-                    self.request_queue.append(request)
-                    self.request_queue.sort(key=lambda x: (-x.priority, x.created_at))
+                    request.created_at = time.monotonic()  # Reset creation time
+                    self._push(request)
                     self.logger.info(f"Retrying {request.request_type.value} (attempt {request.retry_count})")
                     await asyncio.sleep(2 ** request.retry_count)  # Exponential backoff
                 else:
                     self.logger.error(f"Max retries exceeded for {request.request_type.value}")
+                    self._resolve(request)
         
         self.processing = False
     
@@ -228,6 +240,8 @@ class QueueManager:
     
     def clear_queue(self):
         """Clear all pending requests."""
+        for _, _, request in self.request_queue:
+            self._resolve(request)
         self.request_queue.clear()
         self.logger.info("Queue cleared")
 
@@ -3,192 +3,258 @@
 Response generator for the Bluesky sentiment analysis bot.
 """
 
+import functools
+import operator
 import random
-from typing import Dict, Any
+import re
+from typing import Dict, Any, Optional
+from utils import parse_iso_timestamp
+
+# Word tokens used for single-word keyword matching
+_WORD_RE = re.compile(r'\w+')
+
+# Recommendation lines, indexed by ResponseGenerator._get_recommendation
+_RECOMMENDATIONS = (
+    "✅ Yes — here's why:",
+    "❌ No — here's why:",
+    "🤔 Maybe — here's why:",
+)
+
+# Where a post's creation timestamp may live, tried in order
+_TS_PATHS = (
+    operator.attrgetter('post.record.created_at'),
+    operator.attrgetter('post.record.createdAt'),
+    operator.attrgetter('record.createdAt'),
+    operator.attrgetter('createdAt'),
+)
+
+def _extract_timestamp(post) -> Optional[str]:
+    """Return a post's creation timestamp from the first path that exists, or None."""
+    for getter in _TS_PATHS:
+        try:
+            return getter(post)
+        except AttributeError:
+            continue
+    return None
+
+def _count_recent(timestamps, cutoff) -> int:
+    """Count ISO timestamps at or after the cutoff, skipping unparseable ones."""
+    try:
+        # Fast path: a single C-level map/sum pass when every timestamp parses
+        return sum(map(cutoff.__le__, map(parse_iso_timestamp, timestamps)))
+    except (ValueError, TypeError):
+        pass
+    
+    count = 0
+    for timestamp in timestamps:
+        try:
+            if parse_iso_timestamp(timestamp) >= cutoff:
+                count += 1
+        except (ValueError, TypeError):
+            continue
+    return count
 
 class ResponseGenerator:
     """Generates responses based on sentiment and vibe analysis."""
     
+    __slots__ = ('_kw2cat', '_phrase2cat', '_phrase_rx', '_classify_cached')
+    
+    # Vibe descriptions for the new format
+    vibe_descriptions = {
+        'positive': ['Positive', 'Optimistic', 'Uplifting', 'Encouraging'],
+        'negative': ['Critical', 'Skeptical', 'Concerned', 'Cautious'],
+        'neutral': ['Balanced', 'Thoughtful', 'Measured', 'Analytical'],
+        'mixed': ['Complex', 'Nuanced', 'Varied', 'Dynamic']
+    }
+    
+    # Persona mappings
+    personas = {
+        'tech': ['Builder', 'Innovator', 'Creator', 'Developer', 'Architect', 'Engineer'],
+        'business': ['Leader', 'Strategist', 'Entrepreneur', 'Executive', 'Manager', 'Consultant'],
+        'creative': ['Artist', 'Designer', 'Storyteller', 'Visionary', 'Creator', 'Craftsman'],
+        'academic': ['Teacher', 'Researcher', 'Scholar', 'Educator', 'Professor', 'Mentor'],
+        'social': ['Connector', 'Community Builder', 'Networker', 'Influencer', 'Organizer', 'Advocate'],
+        'news': ['Reporter', 'Journalist', 'Analyst', 'Commentator', 'Correspondent', 'Editor'],
+        'lifestyle': ['Enthusiast', 'Curator', 'Guide', 'Inspirer', 'Coach', 'Wellness Expert'],
+        'sports': ['Fan', 'Analyst', 'Commentator', 'Enthusiast', 'Coach', 'Player'],
+        'entertainment': ['Actor', 'Director', 'Producer', 'Performer', 'Host', 'Critic'],
+        'gaming': ['Gamer', 'Streamer', 'Developer', 'Analyst', 'Commentator', 'Pro Player'],
+        'finance': ['Investor', 'Analyst', 'Advisor', 'Trader', 'Planner', 'Expert'],
+        'education': ['Teacher', 'Professor', 'Mentor', 'Trainer', 'Coach', 'Educator'],
+        'health': ['Doctor', 'Nurse', 'Therapist', 'Coach', 'Specialist', 'Practitioner'],
+        'environment': ['Activist', 'Scientist', 'Advocate', 'Researcher', 'Conservationist', 'Expert'],
+        'politics': ['Politician', 'Analyst', 'Commentator', 'Activist', 'Reporter', 'Expert'],
+        'science': ['Scientist', 'Researcher', 'Professor', 'Analyst', 'Expert', 'Scholar']
+    }
+    
+    # Activity levels
+    activity_levels = {
+        'high': ['~3+ posts/day', '~4 posts/day', '~5 posts/day'],
+        'medium': ['~1-2 posts/day', '~2 posts/day', '~1.5 posts/day'],
+        'low': ['~0.5 posts/day', '~1 post/day', 'occasional posts']
+    }
+    
+    # Feed categories
+    feed_categories = {
+        'tech': 'Tech Feed',
+        'business': 'Business Feed', 
+        'creative': 'Creative Feed',
+        'academic': 'Academic Feed',
+        'social': 'Social Feed',
+        'news': 'News Feed',
+        'lifestyle': 'Lifestyle Feed',
+        'sports': 'Sports Feed',
+        'entertainment': 'Entertainment Feed',
+        'gaming': 'Gaming Feed',
+        'finance': 'Finance Feed',
+        'education': 'Education Feed',
+        'health': 'Health Feed',
+        'environment': 'Environment Feed',
+        'politics': 'Politics Feed',
+        'science': 'Science Feed',
+        'general': 'General Feed'
+    }
+    
+    # Content keywords for categorization
+    content_keywords = {
+        'tech': [
+            'code', 'programming', 'software', 'ai', 'technology', 'startup', 'development', 'api', 'database', 'algorithm',
+            'javascript', 'python', 'react', 'node', 'aws', 'cloud', 'devops', 'cybersecurity', 'blockchain', 'crypto',
+            'machine learning', 'ml', 'data science', 'analytics', 'backend', 'frontend', 'mobile', 'ios', 'android',
+            'web3', 'metaverse', 'vr', 'ar', 'iot', 'automation', 'scalability', 'microservices', 'kubernetes', 'docker',
+            'git', 'github', 'stack', 'framework', 'library', 'package', 'deployment', 'testing', 'debugging', 'optimization',
+            'server', 'client', 'protocol', 'interface', 'architecture', 'infrastructure', 'platform', 'service', 'application'
+        ],
+        'business': [
+            'business', 'strategy', 'leadership', 'entrepreneur', 'marketing', 'finance', 'investment', 'revenue', 'growth',
+            'startup', 'venture capital', 'vc', 'funding', 'pitch', 'pivot', 'scaling', 'acquisition', 'merger', 'ipo',
+            'profit', 'loss', 'roi', 'kpi', 'metrics', 'analytics', 'sales', 'customer', 'product', 'market', 'competition',
+            'brand', 'advertising', 'campaign', 'social media', 'content', 'seo', 'sem', 'conversion', 'retention', 'churn',
+            'team', 'hiring', 'culture', 'remote', 'office', 'meeting', 'presentation', 'pitch deck', 'business plan'
+        ],
+        'creative': [
+            'art', 'design', 'creative', 'music', 'film', 'photography', 'writing', 'poetry', 'illustration', 'animation',
+            'painting', 'drawing', 'sculpture', 'digital art', 'graphic design', 'ui', 'ux', 'typography', 'color', 'composition',
+            'cinematography', 'editing', 'directing', 'acting', 'screenplay', 'script', 'storyboard', 'visual effects', 'vfx',
+            'composing', 'producing', 'recording', 'mixing', 'mastering', 'concert', 'performance', 'gallery', 'exhibition',
+            'portfolio', 'commission', 'freelance', 'client', 'project', 'deadline', 'inspiration', 'muse', 'style', 'aesthetic'
+        ],
+        'academic': [
+            'research', 'study', 'education', 'science', 'analysis', 'theory', 'paper', 'conference', 'journal', 'methodology',
+            'phd', 'thesis', 'dissertation', 'peer review', 'citation', 'bibliography', 'hypothesis', 'experiment', 'data',
+            'statistics', 'survey', 'interview', 'qualitative', 'quantitative', 'literature review', 'findings', 'conclusion',
+            'university', 'college', 'professor', 'lecturer', 'student', 'course', 'curriculum', 'syllabus', 'assignment',
+            'grading', 'academic', 'scholarly', 'intellectual', 'knowledge', 'learning', 'teaching', 'pedagogy', 'curriculum'
+        ],
+        'social': [
+            'community', 'social', 'people', 'relationships', 'networking', 'friends', 'family', 'support', 'connection',
+            'conversation', 'discussion', 'debate', 'dialogue', 'collaboration', 'partnership', 'alliance', 'coalition',
+            'group', 'team', 'organization', 'association', 'society', 'club', 'meetup', 'event', 'gathering', 'celebration',
+            'mentorship', 'coaching', 'guidance', 'advice', 'help', 'assistance', 'volunteer', 'charity', 'donation', 'cause',
+            'advocacy', 'activism', 'movement', 'campaign', 'petition', 'protest', 'rally', 'demonstration', 'solidarity'
+        ],
+        'news': [
+            'news', 'politics', 'current events', 'breaking', 'update', 'report', 'announcement', 'statement', 'official',
+            'headline', 'story', 'article', 'coverage', 'investigation', 'exclusive', 'scoop', 'leak', 'source', 'anonymous',
+            'government', 'policy', 'legislation', 'bill', 'law', 'regulation', 'election', 'vote', 'campaign', 'candidate',
+            'democracy', 'republic', 'constitution', 'rights', 'freedom', 'justice', 'court', 'judge', 'lawyer', 'legal',
+            'international', 'foreign', 'diplomacy', 'treaty', 'alliance', 'conflict', 'war', 'peace', 'negotiation', 'summit'
+        ],
+        'lifestyle': [
+            'lifestyle', 'health', 'fitness', 'food', 'travel', 'wellness', 'recipe', 'workout', 'meditation', 'self-care',
+            'nutrition', 'diet', 'organic', 'vegan', 'vegetarian', 'gluten-free', 'keto', 'paleo', 'supplements', 'vitamins',
+            'exercise', 'training', 'gym', 'yoga', 'pilates', 'running', 'cycling', 'swimming', 'weightlifting', 'cardio',
+            'mental health', 'therapy', 'counseling', 'mindfulness', 'stress', 'anxiety', 'depression', 'happiness', 'joy',
+            'fashion', 'style', 'outfit', 'trend', 'beauty', 'skincare', 'makeup', 'hair', 'accessories', 'shopping'
+        ],
+        'sports': [
+            'sports', 'basketball', 'football', 'soccer', 'baseball', 'athlete', 'team', 'coach',
+            'falcons', 'nfl', 'nba', 'mlb', 'nhl', 'tennis', 'golf', 'olympics', 'championship', 'playoff',
+            'season', 'draft', 'trade', 'injury', 'stats', 'score', 'win', 'loss', 'victory', 'defeat', 'price',
+            'move', 'risk', 'quarterback', 'running back', 'wide receiver', 'defense', 'offense', 'touchdown', 'field goal',
+            'home run', 'strikeout', 'basket', 'three pointer', 'free throw', 'rebound', 'assist', 'steal', 'block',
+            'goalie', 'midfielder', 'forward', 'defender', 'goal', 'yellow card', 'red card', 'penalty',
+            'ace', 'serve', 'volley', 'backhand', 'forehand', 'match point', 'set', 'tournament', 'grand slam',
+            'putt', 'drive', 'iron', 'wood', 'par', 'birdie', 'eagle', 'bogey', 'course', 'green', 'fairway', 'rough'
+        ],
+        'entertainment': [
+            'movie', 'film', 'tv', 'television', 'show', 'series', 'episode', 'season', 'premiere', 'finale',
+            'actor', 'actress', 'director', 'producer', 'screenwriter', 'cinematographer', 'editor', 'composer',
+            'award', 'oscar', 'emmy', 'grammy', 'tony', 'golden globe', 'nomination', 'winner', 'ceremony',
+            'red carpet', 'premiere', 'screening', 'box office', 'revenue', 'budget', 'trailer', 'teaser',
+            'comedy', 'drama', 'action', 'horror', 'thriller', 'romance', 'sci-fi', 'fantasy', 'documentary',
+            'reality tv', 'game show', 'talk show', 'news', 'late night', 'morning show', 'streaming', 'netflix',
+            'hulu', 'disney', 'amazon', 'hbo', 'apple', 'youtube', 'podcast', 'radio', 'broadcast', 'live'
+        ],
+        'gaming': [
+            'game', 'gaming', 'video game', 'console', 'pc', 'playstation', 'xbox', 'nintendo', 'switch',
+            'rpg', 'fps', 'mmo', 'moba', 'strategy', 'puzzle', 'platformer', 'adventure', 'simulation',
+            'esports', 'tournament', 'competitive', 'ranked', 'matchmaking', 'leaderboard', 'achievement',
+            'level', 'quest', 'mission', 'boss', 'enemy', 'weapon', 'armor', 'skill', 'ability', 'upgrade',
+            'multiplayer', 'co-op', 'pvp', 'pve', 'guild', 'clan', 'team', 'squad', 'party', 'lobby',
+            'stream', 'twitch', 'youtube gaming', 'speedrun', 'glitch', 'mod', 'dlc', 'expansion', 'update'
+        ],
+        'finance': [
+            'finance', 'money', 'investment', 'stock', 'market', 'trading', 'portfolio', 'dividend', 'interest',
+            'crypto', 'bitcoin', 'ethereum', 'blockchain', 'nft', 'defi', 'token', 'coin', 'wallet', 'exchange',
+            'bank', 'account', 'credit', 'debit', 'loan', 'mortgage', 'insurance', 'retirement', '401k', 'ira',
+            'tax', 'deduction', 'refund', 'income', 'salary', 'bonus', 'commission', 'profit', 'loss', 'revenue',
+            'budget', 'expense', 'saving', 'spending', 'debt', 'credit score', 'fico', 'lending', 'borrowing'
+        ],
+        'education': [
+            'education', 'learning', 'teaching', 'school', 'university', 'college', 'course', 'class', 'lecture',
+            'student', 'teacher', 'professor', 'instructor', 'tutor', 'mentor', 'coach', 'trainer', 'educator',
+            'curriculum', 'syllabus', 'assignment', 'homework', 'project', 'exam', 'test', 'quiz', 'grade',
+            'degree', 'certificate', 'diploma', 'major', 'minor', 'concentration', 'specialization', 'field',
+            'online', 'distance', 'virtual', 'hybrid', 'blended', 'traditional', 'classroom', 'campus', 'dorm'
+        ],
+        'health': [
+            'health', 'medical', 'doctor', 'nurse', 'physician', 'surgeon', 'specialist', 'clinic', 'hospital',
+            'diagnosis', 'treatment', 'therapy', 'medication', 'prescription', 'surgery', 'procedure', 'recovery',
+            'symptom', 'condition', 'disease', 'illness', 'infection', 'injury', 'pain', 'fever', 'cough',
+            'mental health', 'psychology', 'psychiatry', 'therapist', 'counselor', 'psychologist', 'psychiatrist',
+            'anxiety', 'depression', 'stress', 'trauma', 'ptsd', 'ocd', 'adhd', 'autism', 'bipolar', 'schizophrenia'
+        ],
+        'environment': [
+            'environment', 'climate', 'sustainability', 'green', 'eco', 'renewable', 'solar', 'wind', 'energy',
+            'pollution', 'emissions', 'carbon', 'footprint', 'recycling', 'waste', 'plastic', 'ocean', 'forest',
+            'wildlife', 'conservation', 'preservation', 'extinction', 'endangered', 'species', 'habitat', 'ecosystem',
+            'global warming', 'climate change', 'temperature', 'weather', 'storm', 'hurricane', 'drought', 'flood',
+            'agriculture', 'farming', 'organic', 'pesticide', 'fertilizer', 'soil', 'water', 'air', 'quality'
+        ],
+        'politics': [
+            'politics', 'political', 'government', 'policy', 'legislation', 'law', 'bill', 'act', 'regulation',
+            'election', 'vote', 'voting', 'campaign', 'candidate', 'politician', 'senator', 'representative',
+            'president', 'vice president', 'governor', 'mayor', 'congress', 'senate', 'house', 'parliament',
+            'democracy', 'republic', 'constitution', 'amendment', 'rights', 'freedom', 'liberty', 'justice',
+            'liberal', 'conservative', 'progressive', 'moderate', 'independent', 'party', 'republican', 'democrat'
+        ],
+        'science': [
+            'science', 'scientific', 'research', 'study', 'experiment', 'hypothesis', 'theory', 'discovery',
+            'physics', 'chemistry', 'biology', 'astronomy', 'geology', 'meteorology', 'oceanography', 'ecology',
+            'laboratory', 'lab', 'scientist', 'researcher', 'professor', 'phd', 'postdoc', 'fellowship',
+            'publication', 'paper', 'journal', 'conference', 'presentation', 'poster', 'abstract', 'citation',
+            'data', 'analysis', 'statistics', 'model', 'simulation', 'computation', 'algorithm', 'methodology'
+        ]
+    }
+    
     def __init__(self):
         """Initialize the response generator."""
-        # Vibe descriptions for the new format
-        self.vibe_descriptions = {
-            'positive': ['Positive', 'Optimistic', 'Uplifting', 'Encouraging'],
-            'negative': ['Critical', 'Skeptical', 'Concerned', 'Cautious'],
-            'neutral': ['Balanced', 'Thoughtful', 'Measured', 'Analytical'],
-            'mixed': ['Complex', 'Nuanced', 'Varied', 'Dynamic']
-        }
-        
-        # Persona mappings
-        self.personas = {
-            'tech': ['Builder', 'Innovator', 'Creator', 'Developer', 'Architect', 'Engineer'],
-            'business': ['Leader', 'Strategist', 'Entrepreneur', 'Executive', 'Manager', 'Consultant'],
-            'creative': ['Artist', 'Designer', 'Storyteller', 'Visionary', 'Creator', 'Craftsman'],
-            'academic': ['Teacher', 'Researcher', 'Scholar', 'Educator', 'Professor', 'Mentor'],
-            'social': ['Connector', 'Community Builder', 'Networker', 'Influencer', 'Organizer', 'Advocate'],
-            'news': ['Reporter', 'Journalist', 'Analyst', 'Commentator', 'Correspondent', 'Editor'],
-            'lifestyle': ['Enthusiast', 'Curator', 'Guide', 'Inspirer', 'Coach', 'Wellness Expert'],
-            'sports': ['Fan', 'Analyst', 'Commentator', 'Enthusiast', 'Coach', 'Player'],
-            'entertainment': ['Actor', 'Director', 'Producer', 'Performer', 'Host', 'Critic'],
-            'gaming': ['Gamer', 'Streamer', 'Developer', 'Analyst', 'Commentator', 'Pro Player'],
-            'finance': ['Investor', 'Analyst', 'Advisor', 'Trader', 'Planner', 'Expert'],
-            'education': ['Teacher', 'Professor', 'Mentor', 'Trainer', 'Coach', 'Educator'],
-            'health': ['Doctor', 'Nurse', 'Therapist', 'Coach', 'Specialist', 'Practitioner'],
-            'environment': ['Activist', 'Scientist', 'Advocate', 'Researcher', 'Conservationist', 'Expert'],
-            'politics': ['Politician', 'Analyst', 'Commentator', 'Activist', 'Reporter', 'Expert'],
-            'science': ['Scientist', 'Researcher', 'Professor', 'Analyst', 'Expert', 'Scholar']
-        }
-        
-        # Activity levels
-        self.activity_levels = {
-            'high': ['~3+ posts/day', '~4 posts/day', '~5 posts/day'],
-            'medium': ['~1-2 posts/day', '~2 posts/day', '~1.5 posts/day'],
-            'low': ['~0.5 posts/day', '~1 post/day', 'occasional posts']
-        }
-        
-        # Feed categories
-        self.feed_categories = {
-            'tech': 'Tech Feed',
-            'business': 'Business Feed', 
-            'creative': 'Creative Feed',
-            'academic': 'Academic Feed',
-            'social': 'Social Feed',
-            'news': 'News Feed',
-            'lifestyle': 'Lifestyle Feed',
-            'sports': 'Sports Feed',
-            'entertainment': 'Entertainment Feed',
-            'gaming': 'Gaming Feed',
-            'finance': 'Finance Feed',
-            'education': 'Education Feed',
-            'health': 'Health Feed',
-            'environment': 'Environment Feed',
-            'politics': 'Politics Feed',
-            'science': 'Science Feed',
-            'general': 'General Feed'
-        }
+        # Inverted keyword index: single words by token, phrases by one word-bounded alternation
+        self._kw2cat = {}
+        self._phrase2cat = {}
+        for category, keywords in self.content_keywords.items():
+            for keyword in keywords:
+                index = self._kw2cat if _WORD_RE.fullmatch(keyword) else self._phrase2cat
+                categories = index.setdefault(keyword, [])
+                if category not in categories:
+                    categories.append(category)
+        phrases = sorted(self._phrase2cat, key=len, reverse=True)
+        # Lookahead so overlapping phrases ('video game' / 'game show') are all found
+        self._phrase_rx = re.compile(r'(?=\b(' + '|'.join(map(re.escape, phrases)) + r')\b)')
         
-        # Content keywords for categorization
-        self.content_keywords = {
-            'tech': [
-                'code', 'programming', 'software', 'ai', 'technology', 'startup', 'development', 'api', 'database', 'algorithm',
-                'javascript', 'python', 'react', 'node', 'aws', 'cloud', 'devops', 'cybersecurity', 'blockchain', 'crypto',
-                'machine learning', 'ml', 'data science', 'analytics', 'backend', 'frontend', 'mobile', 'ios', 'android',
-                'web3', 'metaverse', 'vr', 'ar', 'iot', 'automation', 'scalability', 'microservices', 'kubernetes', 'docker',
-                'git', 'github', 'stack', 'framework', 'library', 'package', 'deployment', 'testing', 'debugging', 'optimization',
-                'server', 'client', 'protocol', 'interface', 'architecture', 'infrastructure', 'platform', 'service', 'application'
-            ],
-            'business': [
-                'business', 'strategy', 'leadership', 'entrepreneur', 'marketing', 'finance', 'investment', 'revenue', 'growth',
-                'startup', 'venture capital', 'vc', 'funding', 'pitch', 'pivot', 'scaling', 'acquisition', 'merger', 'ipo',
-                'profit', 'loss', 'roi', 'kpi', 'metrics', 'analytics', 'sales', 'customer', 'product', 'market', 'competition',
-                'brand', 'advertising', 'campaign', 'social media', 'content', 'seo', 'sem', 'conversion', 'retention', 'churn',
-                'team', 'hiring', 'culture', 'remote', 'office', 'meeting', 'presentation', 'pitch deck', 'business plan'
-            ],
-            'creative': [
-                'art', 'design', 'creative', 'music', 'film', 'photography', 'writing', 'poetry', 'illustration', 'animation',
-                'painting', 'drawing', 'sculpture', 'digital art', 'graphic design', 'ui', 'ux', 'typography', 'color', 'composition',
-                'cinematography', 'editing', 'directing', 'acting', 'screenplay', 'script', 'storyboard', 'visual effects', 'vfx',
-                'composing', 'producing', 'recording', 'mixing', 'mastering', 'concert', 'performance', 'gallery', 'exhibition',
-                'portfolio', 'commission', 'freelance', 'client', 'project', 'deadline', 'inspiration', 'muse', 'style', 'aesthetic'
-            ],
-            'academic': [
-                'research', 'study', 'education', 'science', 'analysis', 'theory', 'paper', 'conference', 'journal', 'methodology',
-                'phd', 'thesis', 'dissertation', 'peer review', 'citation', 'bibliography', 'hypothesis', 'experiment', 'data',
-                'statistics', 'survey', 'interview', 'qualitative', 'quantitative', 'literature review', 'findings', 'conclusion',
-                'university', 'college', 'professor', 'lecturer', 'student', 'course', 'curriculum', 'syllabus', 'assignment',
-                'grading', 'academic', 'scholarly', 'intellectual', 'knowledge', 'learning', 'teaching', 'pedagogy', 'curriculum'
-            ],
-            'social': [
-                'community', 'social', 'people', 'relationships', 'networking', 'friends', 'family', 'support', 'connection',
-                'conversation', 'discussion', 'debate', 'dialogue', 'collaboration', 'partnership', 'alliance', 'coalition',
-                'group', 'team', 'organization', 'association', 'society', 'club', 'meetup', 'event', 'gathering', 'celebration',
-                'mentorship', 'coaching', 'guidance', 'advice', 'help', 'assistance', 'volunteer', 'charity', 'donation', 'cause',
-                'advocacy', 'activism', 'movement', 'campaign', 'petition', 'protest', 'rally', 'demonstration', 'solidarity'
-            ],
-            'news': [
-                'news', 'politics', 'current events', 'breaking', 'update', 'report', 'announcement', 'statement', 'official',
-                'headline', 'story', 'article', 'coverage', 'investigation', 'exclusive', 'scoop', 'leak', 'source', 'anonymous',
-                'government', 'policy', 'legislation', 'bill', 'law', 'regulation', 'election', 'vote', 'campaign', 'candidate',
-                'democracy', 'republic', 'constitution', 'rights', 'freedom', 'justice', 'court', 'judge', 'lawyer', 'legal',
-                'international', 'foreign', 'diplomacy', 'treaty', 'alliance', 'conflict', 'war', 'peace', 'negotiation', 'summit'
-            ],
-            'lifestyle': [
-                'lifestyle', 'health', 'fitness', 'food', 'travel', 'wellness', 'recipe', 'workout', 'meditation', 'self-care',
-                'nutrition', 'diet', 'organic', 'vegan', 'vegetarian', 'gluten-free', 'keto', 'paleo', 'supplements', 'vitamins',
-                'exercise', 'training', 'gym', 'yoga', 'pilates', 'running', 'cycling', 'swimming', 'weightlifting', 'cardio',
-                'mental health', 'therapy', 'counseling', 'mindfulness', 'stress', 'anxiety', 'depression', 'happiness', 'joy',
-                'fashion', 'style', 'outfit', 'trend', 'beauty', 'skincare', 'makeup', 'hair', 'accessories', 'shopping'
-            ],
-            'sports': [
-                'sports', 'basketball', 'football', 'soccer', 'baseball', 'athlete', 'team', 'coach',
-                'falcons', 'nfl', 'nba', 'mlb', 'nhl', 'tennis', 'golf', 'olympics', 'championship', 'playoff',
-                'season', 'draft', 'trade', 'injury', 'stats', 'score', 'win', 'loss', 'victory', 'defeat', 'price',
-                'move', 'risk', 'quarterback', 'running back', 'wide receiver', 'defense', 'offense', 'touchdown', 'field goal',
-                'home run', 'strikeout', 'basket', 'three pointer', 'free throw', 'rebound', 'assist', 'steal', 'block',
-                'goalie', 'midfielder', 'forward', 'defender', 'goal', 'yellow card', 'red card', 'penalty',
-                'ace', 'serve', 'volley', 'backhand', 'forehand', 'match point', 'set', 'tournament', 'grand slam',
-                'putt', 'drive', 'iron', 'wood', 'par', 'birdie', 'eagle', 'bogey', 'course', 'green', 'fairway', 'rough'
-            ],
-            'entertainment': [
-                'movie', 'film', 'tv', 'television', 'show', 'series', 'episode', 'season', 'premiere', 'finale',
-                'actor', 'actress', 'director', 'producer', 'screenwriter', 'cinematographer', 'editor', 'composer',
-                'award', 'oscar', 'emmy', 'grammy', 'tony', 'golden globe', 'nomination', 'winner', 'ceremony',
-                'red carpet', 'premiere', 'screening', 'box office', 'revenue', 'budget', 'trailer', 'teaser',
-                'comedy', 'drama', 'action', 'horror', 'thriller', 'romance', 'sci-fi', 'fantasy', 'documentary',
-                'reality tv', 'game show', 'talk show', 'news', 'late night', 'morning show', 'streaming', 'netflix',
-                'hulu', 'disney', 'amazon', 'hbo', 'apple', 'youtube', 'podcast', 'radio', 'broadcast', 'live'
-            ],
-            'gaming': [
-                'game', 'gaming', 'video game', 'console', 'pc', 'playstation', 'xbox', 'nintendo', 'switch',
-                'rpg', 'fps', 'mmo', 'moba', 'strategy', 'puzzle', 'platformer', 'adventure', 'simulation',
-                'esports', 'tournament', 'competitive', 'ranked', 'matchmaking', 'leaderboard', 'achievement',
-                'level', 'quest', 'mission', 'boss', 'enemy', 'weapon', 'armor', 'skill', 'ability', 'upgrade',
-                'multiplayer', 'co-op', 'pvp', 'pve', 'guild', 'clan', 'team', 'squad', 'party', 'lobby',
-                'stream', 'twitch', 'youtube gaming', 'speedrun', 'glitch', 'mod', 'dlc', 'expansion', 'update'
-            ],
-            'finance': [
-                'finance', 'money', 'investment', 'stock', 'market', 'trading', 'portfolio', 'dividend', 'interest',
-                'crypto', 'bitcoin', 'ethereum', 'blockchain', 'nft', 'defi', 'token', 'coin', 'wallet', 'exchange',
-                'bank', 'account', 'credit', 'debit', 'loan', 'mortgage', 'insurance', 'retirement', '401k', 'ira',
-                'tax', 'deduction', 'refund', 'income', 'salary', 'bonus', 'commission', 'profit', 'loss', 'revenue',
-                'budget', 'expense', 'saving', 'spending', 'debt', 'credit score', 'fico', 'lending', 'borrowing'
-            ],
-            'education': [
-                'education', 'learning', 'teaching', 'school', 'university', 'college', 'course', 'class', 'lecture',
-                'student', 'teacher', 'professor', 'instructor', 'tutor', 'mentor', 'coach', 'trainer', 'educator',
-                'curriculum', 'syllabus', 'assignment', 'homework', 'project', 'exam', 'test', 'quiz', 'grade',
-                'degree', 'certificate', 'diploma', 'major', 'minor', 'concentration', 'specialization', 'field',
-                'online', 'distance', 'virtual', 'hybrid', 'blended', 'traditional', 'classroom', 'campus', 'dorm'
-            ],
-            'health': [
-                'health', 'medical', 'doctor', 'nurse', 'physician', 'surgeon', 'specialist', 'clinic', 'hospital',
-                'diagnosis', 'treatment', 'therapy', 'medication', 'prescription', 'surgery', 'procedure', 'recovery',
-                'symptom', 'condition', 'disease', 'illness', 'infection', 'injury', 'pain', 'fever', 'cough',
-                'mental health', 'psychology', 'psychiatry', 'therapist', 'counselor', 'psychologist', 'psychiatrist',
-                'anxiety', 'depression', 'stress', 'trauma', 'ptsd', 'ocd', 'adhd', 'autism', 'bipolar', 'schizophrenia'
-            ],
-            'environment': [
-                'environment', 'climate', 'sustainability', 'green', 'eco', 'renewable', 'solar', 'wind', 'energy',
-                'pollution', 'emissions', 'carbon', 'footprint', 'recycling', 'waste', 'plastic', 'ocean', 'forest',
-                'wildlife', 'conservation', 'preservation', 'extinction', 'endangered', 'species', 'habitat', 'ecosystem',
-                'global warming', 'climate change', 'temperature', 'weather', 'storm', 'hurricane', 'drought', 'flood',
-                'agriculture', 'farming', 'organic', 'pesticide', 'fertilizer', 'soil', 'water', 'air', 'quality'
-            ],
-            'politics': [
-                'politics', 'political', 'government', 'policy', 'legislation', 'law', 'bill', 'act', 'regulation',
-                'election', 'vote', 'voting', 'campaign', 'candidate', 'politician', 'senator', 'representative',
-                'president', 'vice president', 'governor', 'mayor', 'congress', 'senate', 'house', 'parliament',
-                'democracy', 'republic', 'constitution', 'amendment', 'rights', 'freedom', 'liberty', 'justice',
-                'liberal', 'conservative', 'progressive', 'moderate', 'independent', 'party', 'republican', 'democrat'
-            ],
-            'science': [
-                'science', 'scientific', 'research', 'study', 'experiment', 'hypothesis', 'theory', 'discovery',
-                'physics', 'chemistry', 'biology', 'astronomy', 'geology', 'meteorology', 'oceanography', 'ecology',
-                'laboratory', 'lab', 'scientist', 'researcher', 'professor', 'phd', 'postdoc', 'fellowship',
-                'publication', 'paper', 'journal', 'conference', 'presentation', 'poster', 'abstract', 'citation',
-                'data', 'analysis', 'statistics', 'model', 'simulation', 'computation', 'algorithm', 'methodology'
-            ]
-        }
+        # Cache classifications; the same account is often analyzed again
+        self._classify_cached = functools.lru_cache(maxsize=32)(self._classify_content)
     
     def _get_vibe_description(self, vibe_score: float) -> str:
         """Get a vibe description based on the vibe score."""
@@ -201,26 +267,35 @@ class ResponseGenerator:
         else:
             return random.choice(self.vibe_descriptions['mixed'])
     
-    def _get_persona(self, content: str) -> str:
-        """Determine the persona based on content keywords."""
+    def _classify_content(self, content: str) -> Optional[str]:
+        """Return the content category with the most distinct keyword matches, if any."""
         content_lower = content.lower()
-        content_words = set(content_lower.split())
         
-        # Score each category based on keyword matches
-        category_scores = {}
+        # Score each category based on distinct keyword matches
+        category_scores = dict.fromkeys(self.content_keywords, 0)
         
-        for category, keywords in self.content_keywords.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in content_words or keyword in content_lower:
-                    score += 1
-            if score > 0:
-                category_scores[category] = score
+        for word in set(_WORD_RE.findall(content_lower)):
+            for category in self._kw2cat.get(word, ()):
+                category_scores[category] += 1
+        for phrase in set(self._phrase_rx.findall(content_lower)):
+            for category in self._phrase2cat[phrase]:
+                category_scores[category] += 1
         
+        best_category = max(category_scores, key=category_scores.get)
+        if category_scores[best_category] > 0:
+            return best_category
+        
+        return None
+    
+    def _get_persona(self, content: str) -> str:
+        """Determine the persona based on content keywords."""
+        return self._persona_for_category(self._classify_cached(content))
+    
+    def _persona_for_category(self, category: Optional[str]) -> str:
+        """Pick a persona for an already classified content category."""
         # Return persona from category with highest score
-        if category_scores:
-            best_category = max(category_scores, key=category_scores.get)
-            return random.choice(self.personas.get(best_category, ['Creator']))
+        if category:
+            return random.choice(self.personas.get(category, ['Creator']))
         
         return random.choice(['Creator', 'Thinker', 'Builder'])
     
@@ -246,42 +321,16 @@ class ResponseGenerator:
             # Calculate 30 days ago
             thirty_days_ago = now - timedelta(days=30)
             
-            posts_in_last_30d = 0
-            
             # Check if we're getting timestamps or full post objects
             if posts_data and isinstance(posts_data[0], str):
                 # We have timestamps directly
-                for timestamp in posts_data:
-                    try:
-                        post_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        if post_time >= thirty_days_ago:
-                            posts_in_last_30d += 1
-                    except (ValueError, TypeError):
-                        continue
+                timestamps = posts_data
             else:
                 # We have full post objects, extract timestamps
-                for post in posts_data:
-                    # Extract timestamp
-                    timestamp = None
-                    if hasattr(post, 'post') and hasattr(post.post, 'record') and hasattr(post.post.record, 'created_at'):
-                        timestamp = post.post.record.created_at
-                    elif hasattr(post, 'post') and hasattr(post.post, 'record') and hasattr(post.post.record, 'createdAt'):
-                        timestamp = post.post.record.createdAt
-                    elif hasattr(post, 'record') and hasattr(post.record, 'createdAt'):
-                        timestamp = post.record.createdAt
-                    elif hasattr(post, 'createdAt'):
-                        timestamp = post.createdAt
-                    else:
-                        continue
-                    
-                    # Parse timestamp
-                    try:
-                        post_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        # Check if post is within last 30 days
-                        if post_time >= thirty_days_ago:
-                            posts_in_last_30d += 1
-                    except (ValueError, TypeError):
-                        continue
+                timestamps = [ts for ts in map(_extract_timestamp, posts_data) if ts is not None]
+            
+            # Count posts within the last 30 days
+            posts_in_last_30d = _count_recent(timestamps, thirty_days_ago)
             
             # Calculate average posts per day over the last 30 days
             posts_per_day = posts_in_last_30d / 30.0
@@ -295,27 +344,24 @@ class ResponseGenerator:
     
     def _get_feed_category(self, content: str) -> str:
         """Determine the appropriate feed category."""
-        content_lower = content.lower()
-        content_words = set(content_lower.split())
-        
-        # Score each category based on keyword matches
-        category_scores = {}
-        
-        for category, keywords in self.content_keywords.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in content_words or keyword in content_lower:
-                    score += 1
-            if score > 0:
-                category_scores[category] = score
-        
+        return self._feed_for_category(self._classify_cached(content))
+    
+    def _feed_for_category(self, category: Optional[str]) -> str:
+        """Map an already classified content category to its feed."""
         # Return feed category from category with highest score
-        if category_scores:
-            best_category = max(category_scores, key=category_scores.get)
-            return self.feed_categories[best_category]
+        if category:
+            return self.feed_categories[category]
         
         return self.feed_categories['general']
     
+    def _get_recommendation(self, sentiment_score: float, vibe_score: float) -> str:
+        """Pick the follow recommendation line from the sentiment and vibe scores."""
+        if sentiment_score > 0.1 and vibe_score > 0.1:
+            return _RECOMMENDATIONS[0]
+        if sentiment_score < -0.1 or vibe_score < -0.1:
+            return _RECOMMENDATIONS[1]
+        return _RECOMMENDATIONS[2]
+    
     def _should_respond(self, sentiment_score: float, vibe_score: float) -> bool:
         """Determine if we should respond to this content."""
         # Always respond to mentions
@@ -330,6 +376,15 @@ class ResponseGenerator:
         if not self._should_respond(sentiment_score, vibe_score):
             return None
         
+        # Generate components (classify the content once for persona and feed)
+        vibe_desc = self._get_vibe_description(vibe_score)
+        best_category = self._classify_cached(content)
+        persona = self._persona_for_category(best_category)
+        feed_category = self._feed_for_category(best_category)
+        
+        # Determine recommendation
+        recommendation = self._get_recommendation(sentiment_score, vibe_score)
+        
         # Calculate actual posts per day if posts data is provided
         posts_per_day = 1.0  # Default value
         if posts_data:
@@ -347,19 +402,6 @@ class ResponseGenerator:
             post_count = max(1, len(content.split()) // 20)
             activity = self._get_activity_level(post_count)
         
-        # Generate components
-        vibe_desc = self._get_vibe_description(vibe_score)
-        persona = self._get_persona(content)
-        feed_category = self._get_feed_category(content)
-        
-        # Determine recommendation
-        if sentiment_score > 0.1 and vibe_score > 0.1:
-            recommendation = "✅ Yes — here's why:"
-        elif sentiment_score < -0.1 or vibe_score < -0.1:
-            recommendation = "❌ No — here's why:"
-        else:
-            recommendation = "🤔 Maybe — here's why:"
-        
         # Generate response
         response = f"""Should you follow @{handle}?
 {recommendation}
@@ -370,3 +412,9 @@ class ResponseGenerator:
 📌 Add to your {feed_category}."""
         
         return response
+
+
+@functools.lru_cache(maxsize=1)
+def get_response_generator() -> ResponseGenerator:
+    """Return the shared ResponseGenerator."""
+    return ResponseGenerator()
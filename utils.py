@@ -4,8 +4,31 @@ Utility functions for the ReputeBot.
 """
 
 import datetime
+import functools
 import re
-from typing import List, Dict, Any
+from collections import OrderedDict
+from typing import List, Dict, Any, Hashable, Iterator
+
+# Text patterns, compiled once at import
+_HASHTAG_RE = re.compile(r"#(\w+)")
+_MENTION_RE = re.compile(r"@(\w+)")
+_URL_RE = re.compile(r'https?://[!$-_a-z]+')  # one class covering letters, digits, $-_ punctuation, !*(), and %XX
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+_EMOJI_RE = re.compile("["
+    u"\U0001F600-\U0001F64F"  # emoticons
+    u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+    u"\U0001F680-\U0001F6FF"  # transport & map symbols
+    u"\U0001F1E0-\U0001F1FF"  # flags
+    u"\U00002700-\U000027BF"  # dingbats
+    u"\U0001F900-\U0001F9FF"  # supplemental symbols
+    u"\U00002600-\U000026FF"  # miscellaneous symbols
+    u"\U0001FA70-\U0001FAFF"  # extended symbols
+    "]+", flags=re.UNICODE)
+
+# Byte table mapping A-Z to 1, a-z to 2 and everything else to 0, for counting ASCII letters
+_LETTER_CASE_TABLE = bytes(
+    1 if 65 <= b <= 90 else 2 if 97 <= b <= 122 else 0 for b in range(256)
+)
 
 def truncate_text(text: str, max_length: int = 280) -> str:
     """Truncate text to a specific length with ellipsis if needed."""
@@ -17,29 +40,38 @@ def get_current_time_iso() -> str:
 
 def extract_hashtags(text: str) -> List[str]:
     """Extract hashtags from text."""
-    return re.findall(r"#(\w+)", text)
+    return _HASHTAG_RE.findall(text) if '#' in text else []
 
 def extract_mentions(text: str) -> List[str]:
     """Extract mentions from text."""
-    return re.findall(r"@(\w+)", text)
+    return _MENTION_RE.findall(text) if '@' in text else []
 
-def clean_text_for_analysis(text: str) -> str:
-    """Clean text for sentiment analysis by removing URLs, mentions, and extra whitespace."""
+def strip_entities(text: str) -> str:
+    """Remove URLs and mentions, keep hashtag text, and collapse whitespace."""
+    # Each pass only runs if its marker character is present; most posts have none of them
     # Remove URLs
-    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    if '://' in text:
+        text = _URL_RE.sub('', text)
     
     # Remove mentions but keep the text
-    text = re.sub(r'@\w+', '', text)
+    if '@' in text:
+        text = _MENTION_RE.sub('', text)
     
     # Remove hashtags but keep the text
-    text = re.sub(r'#(\w+)', r'\1', text)
+    if '#' in text:
+        text = _HASHTAG_RE.sub(r'\1', text)
     
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    return collapse_whitespace(text)
 
+def collapse_whitespace(text: str) -> str:
+    """Collapse whitespace runs to single spaces and trim the ends."""
+    # split() breaks on exactly the characters \s matches
+    return ' '.join(text.split())
+
+def clean_text_for_analysis(text: str) -> str:
+    """Clean text for sentiment analysis by removing URLs, mentions, and extra whitespace."""
     # Normalize to lowercase for consistency
-    text = text.lower()
-    return text
+    return strip_entities(text).lower()
 
 def get_word_count(text: str) -> int:
     """Get the word count of a text."""
@@ -47,18 +79,23 @@ def get_word_count(text: str) -> int:
 
 def get_sentence_count(text: str) -> int:
     """Get the sentence count of a text."""
-    return len(re.split(r'[.!?]+', text))
+    # Sentences = terminator runs + 1
+    if '.' not in text and '!' not in text and '?' not in text:
+        return 1
+    return len(_SENTENCE_END_RE.findall(text)) + 1
 
 def get_capitalization_ratio(text: str) -> float:
     """Get the ratio of capitalized letters to total letters."""
     if not text:
         return 0.0
     
-    total_letters = len(re.findall(r'[a-zA-Z]', text))
+    # Drop non-ASCII, then map each byte to its letter class
+    letter_classes = text.encode('ascii', 'ignore').translate(_LETTER_CASE_TABLE)
+    capital_letters = letter_classes.count(1)
+    total_letters = capital_letters + letter_classes.count(2)
     if total_letters == 0:
         return 0.0
     
-    capital_letters = len(re.findall(r'[A-Z]', text))
     return capital_letters / total_letters
 
 def is_valid_post(text: str, min_length: int = 10, max_length: int = 300) -> bool:
@@ -71,10 +108,15 @@ def is_valid_post(text: str, min_length: int = 10, max_length: int = 300) -> boo
     
     return True
 
+@functools.lru_cache(maxsize=4096)
+def parse_iso_timestamp(timestamp: str) -> datetime.datetime:
+    """Parse an ISO 8601 timestamp (with optional 'Z' suffix), caching by the raw string."""
+    return datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
 def format_timestamp(timestamp: str) -> str:
     """Format a timestamp for display."""
     try:
-        dt = datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        dt = parse_iso_timestamp(timestamp)
         return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
     except Exception as e:
         print(f"Timestamp formatting error: {e}")
@@ -94,14 +136,32 @@ def safe_get_nested(data: Dict[str, Any], *keys, default=None) -> Any:
 # Emoji extraction utility
 def extract_emojis(text: str) -> List[str]:
     """Extract emojis from the text."""
-    emoji_pattern = re.compile("["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport & map symbols
-        u"\U0001F1E0-\U0001F1FF"  # flags
-        u"\U00002700-\U000027BF"  # dingbats
-        u"\U0001F900-\U0001F9FF"  # supplemental symbols
-        u"\U00002600-\U000026FF"  # miscellaneous symbols
-        u"\U0001FA70-\U0001FAFF"  # extended symbols
-        "]+", flags=re.UNICODE)
-    return emoji_pattern.findall(text)
+    return _EMOJI_RE.findall(text)
+
+
+class BoundedSeenSet:
+    """Set-like record of seen keys that keeps only the most recently added entries."""
+    
+    def __init__(self, maxlen: int = 10000):
+        self.maxlen = maxlen
+        self._items = OrderedDict()
+    
+    def add(self, key: Hashable):
+        """Add a key, evicting the oldest entry once maxlen is exceeded."""
+        self._items[key] = None
+        self._items.move_to_end(key)
+        if len(self._items) > self.maxlen:
+            self._items.popitem(last=False)
+    
+    def clear(self):
+        """Remove all keys."""
+        self._items.clear()
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+    
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._items)
+    
+    def __len__(self) -> int:
+        return len(self._items)
@@ -3,10 +3,24 @@
 Vibe analyzer for determining the overall mood and tone of posts.
 """
 
+import bisect
+import functools
 import re
 import string
-from typing import Dict, List, Tuple
+from collections import Counter
+from typing import Dict, List, Tuple, Union
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from utils import extract_hashtags, extract_mentions, strip_entities
+
+# Text patterns, compiled once at import
+_WORD_RE = re.compile(r'\w+')
+
+# Vibe score cut-offs and the description for each band between them, lowest first
+_VIBE_THRESHOLDS = (-0.8, -0.5, -0.2, 0.2, 0.5, 0.8)
+_VIBE_LABELS = (
+    "extremely negative", "very negative", "negative", "neutral",
+    "positive", "very positive", "extremely positive",
+)
 
 class VibeAnalyzer:
     """Analyzes the overall vibe/mood of posts."""
@@ -14,41 +28,74 @@ class VibeAnalyzer:
     def __init__(self):
         """Initialize the vibe analyzer."""
         self.sentiment_analyzer = SentimentIntensityAnalyzer()
+        self._polarity = self.sentiment_analyzer.polarity_scores
         
         # Keywords that indicate different vibes
         self.vibe_keywords = {
-            'positive': [
+            'positive': (
                 'amazing', 'awesome', 'beautiful', 'brilliant', 'excellent', 'fantastic',
                 'great', 'incredible', 'love', 'wonderful', 'perfect', 'happy', 'joy',
                 'excited', 'thrilled', 'grateful', 'blessed', 'inspired', 'motivated'
-            ],
-            'negative': [
+            ),
+            'negative': (
                 'terrible', 'awful', 'horrible', 'disgusting', 'hate', 'angry',
                 'frustrated', 'disappointed', 'sad', 'depressed', 'anxious', 'worried',
                 'scared', 'terrified', 'devastated', 'heartbroken', 'miserable'
-            ],
-            'neutral': [
+            ),
+            'neutral': (
                 'okay', 'fine', 'alright', 'normal', 'regular', 'standard', 'average',
                 'decent', 'acceptable', 'reasonable', 'moderate', 'balanced'
-            ],
-            'intense': [
+            ),
+            'intense': (
                 'absolutely', 'completely', 'totally', 'extremely', 'incredibly',
                 'massively', 'hugely', 'enormously', 'dramatically', 'radically'
-            ],
-            'casual': [
+            ),
+            'casual': (
                 'lol', 'haha', 'omg', 'wow', 'cool', 'nice', 'yeah', 'yep', 'nope',
                 'idk', 'imo', 'tbh', 'btw', 'fyi', 'jk', 'smh', 'fml'
-            ]
+            )
+        }
+        
+        # Keyword -> vibe type
+        self._keyword_types = {
+            keyword: vibe_type
+            for vibe_type, keywords in self.vibe_keywords.items()
+            for keyword in keywords
         }
+        
+        # Memoize scores by cleaned text; feeds repeat posts
+        self._score_cached = functools.lru_cache(maxsize=4096)(self._score_cleaned)
     
     # TODO: Future enhancement: Use context window or co-occurrence with emojis for sarcasm detection
-    def analyze_vibe(self, text: str) -> Dict[str, float]:
-        """Analyze the overall vibe of a text."""
-        # Clean the text
-        cleaned_text = self._clean_text(text)
+    def analyze_vibe(self, text: Union[str, List[str]]) -> Dict[str, float]:
+        """Analyze the overall vibe of a text, or of a list of posts analyzed individually and aggregated."""
+        if not isinstance(text, str):
+            return self._analyze_posts(text)
+        
+        # Blank text needs no cleaning
+        if not text or text.isspace():
+            return self.analyze_cleaned('', '')
+        
+        return self.analyze_cleaned(text, self._clean_text(text))
+    
+    def analyze_cleaned(self, text: str, cleaned_text: str) -> Dict[str, float]:
+        """Analyze a text whose _clean_text form has already been computed."""
+        vibe_score, sentiment_scores, keyword_scores = self._score_cached(cleaned_text)
         
+        # Copy the cached dicts so callers can't alter later results
+        return {
+            'overall_vibe': vibe_score,
+            'sentiment': dict(sentiment_scores),
+            'keyword_analysis': dict(keyword_scores),
+            'text_length': len(cleaned_text),
+            'hashtags': extract_hashtags(text),
+            'mentions': extract_mentions(text)
+        }
+    
+    def _score_cleaned(self, cleaned_text: str) -> Tuple[float, Dict[str, float], Dict[str, float]]:
+        """Compute the vibe score, sentiment scores and keyword scores of a cleaned text."""
         # Get sentiment scores
-        sentiment_scores = self.sentiment_analyzer.polarity_scores(cleaned_text)
+        sentiment_scores = self._polarity(cleaned_text)
         
         # Analyze keyword presence
         keyword_scores = self._analyze_keywords(cleaned_text)
@@ -56,41 +103,62 @@ class VibeAnalyzer:
         # Combine sentiment and keyword analysis
         vibe_score = self._combine_scores(sentiment_scores, keyword_scores)
         
+        return vibe_score, sentiment_scores, keyword_scores
+    
+    def analyze_many(self, texts: List[str]) -> List[Dict[str, float]]:
+        """Analyze the vibe of each text in one batch, in order."""
+        # Bind the per-text steps once and skip analyze_vibe's str/list dispatch
+        clean = self._clean_text
+        analyze = self.analyze_cleaned
+        return [analyze(text, clean(text)) for text in texts]
+    
+    def _analyze_posts(self, posts: List[str]) -> Dict[str, float]:
+        """Analyze each post separately and aggregate into a single analyze_vibe-shaped result."""
+        return self.aggregate(self.analyze_many([p for p in posts if p and p.strip()]))
+    
+    def aggregate(self, results: List[Dict[str, float]]) -> Dict[str, float]:
+        """Combine per-post analyze_vibe results into a single analyze_vibe-shaped result."""
+        if not results:
+            return {**self.analyze_vibe(''), 'hashtag_counts': Counter(), 'post_count': 0}
+        
+        count = len(results)
+        hashtag_counts = Counter(tag for r in results for tag in r['hashtags'])
+        
         return {
-            'overall_vibe': vibe_score,
-            'sentiment': sentiment_scores,
-            'keyword_analysis': keyword_scores,
-            'text_length': len(cleaned_text),
-            'hashtags': self._extract_hashtags(text),
-            'mentions': self._extract_mentions(text)
+            'overall_vibe': sum(r['overall_vibe'] for r in results) / count,
+            'sentiment': {
+                key: sum(r['sentiment'][key] for r in results) / count
+                for key in ('neg', 'neu', 'pos', 'compound')
+            },
+            'keyword_analysis': {
+                vibe_type: sum(r['keyword_analysis'][vibe_type] for r in results) / count
+                for vibe_type in self.vibe_keywords
+            },
+            'text_length': sum(r['text_length'] for r in results),
+            'hashtags': list(hashtag_counts.elements()),
+            'hashtag_counts': hashtag_counts,
+            'mentions': [m for r in results for m in r['mentions']],
+            'post_count': count
         }
     
     def _clean_text(self, text: str) -> str:
         """Clean text for analysis."""
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        
-        # Remove mentions but keep the text
-        text = re.sub(r'@\w+', '', text)
-        
-        # Remove hashtags but keep the text
-        text = re.sub(r'#(\w+)', r'\1', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return strip_entities(text)
     
     def _analyze_keywords(self, text: str) -> Dict[str, float]:
         """Analyze presence of vibe keywords."""
-        text_lower = text.lower()
-        scores = {}
+        counts = dict.fromkeys(self.vibe_keywords, 0)
+        keyword_type = self._keyword_types.get
+        # A whole-word keyword match is exactly a \w+ token equal to the keyword
+        for word in _WORD_RE.findall(text.lower()):
+            vibe_type = keyword_type(word)
+            if vibe_type is not None:
+                counts[vibe_type] += 1
         
-        for vibe_type, keywords in self.vibe_keywords.items():
-            count = sum(len(re.findall(rf'\\b{re.escape(keyword)}\\b', text_lower)) for keyword in keywords)
-            scores[vibe_type] = count / len(keywords) if keywords else 0
-        
-        return scores
+        return {
+            vibe_type: counts[vibe_type] / len(keywords) if keywords else 0
+            for vibe_type, keywords in self.vibe_keywords.items()
+        }
     
     def _combine_scores(self, sentiment_scores: Dict[str, float], keyword_scores: Dict[str, float]) -> float:
         """Combine sentiment and keyword scores into overall vibe."""
@@ -110,27 +178,13 @@ class VibeAnalyzer:
         # Clamp to [-1, 1] range
         return max(-1.0, min(1.0, base_score))
     
-    def _extract_hashtags(self, text: str) -> List[str]:
-        """Extract hashtags from text."""
-        return re.findall(r'#(\w+)', text)
-    
-    def _extract_mentions(self, text: str) -> List[str]:
-        """Extract mentions from text."""
-        return re.findall(r'@(\w+)', text)
-    
     def get_vibe_description(self, vibe_score: float) -> str:
         """Get a human-readable description of the vibe."""
-        if vibe_score >= 0.8:
-            return "extremely positive"
-        elif vibe_score >= 0.5:
-            return "very positive"
-        elif vibe_score >= 0.2:
-            return "positive"
-        elif vibe_score >= -0.2:
-            return "neutral"
-        elif vibe_score >= -0.5:
-            return "negative"
-        elif vibe_score >= -0.8:
-            return "very negative"
-        else:
-            return "extremely negative" 
+        # Each threshold is the inclusive lower bound of the next label up
+        return _VIBE_LABELS[bisect.bisect_right(_VIBE_THRESHOLDS, vibe_score)]
+
+
+@functools.lru_cache(maxsize=1)
+def get_vibe_analyzer() -> VibeAnalyzer:
+    """Return the shared VibeAnalyzer."""
+    return VibeAnalyzer()